@@ -251,7 +251,7 @@ def schema() -> None:
             f"\n  Available plugins: {pl_avail}"
         )
         parser.error(errmsg)
-    jsonschema = create_schema(list(plugins))
+    jsonschema = create_schema(sorted(plugins))
     print(json.dumps(jsonschema, indent=2))
 
 
@@ -13,6 +13,9 @@ from metasyn.privacy import BasePrivacy, BasicPrivacy, get_privacy
 from metasyn.provider import DistributionProviderList
 from metasyn.varspec import VarSpec
 
+# Sentinel for attributes that are not set on the variable specification.
+_MISSING = object()
+
 
 class MetaConfig():
     """Configuration class for creating MetaFrames.
@@ -171,9 +174,10 @@ class MetaConfig():
         var_spec:
             VarSpecAccess class for each of the available variable configurations.
         """
-        exclude = exclude if exclude is not None else []
+        # Use a set, so that excluding all columns of a wide dataframe stays cheap.
+        exclude_set = set(exclude) if exclude is not None else set()
         for var_spec in self.var_specs:
-            if var_spec.name not in exclude:
+            if var_spec.name not in exclude_set:
                 yield VarSpecAccess(var_spec, self)
 
 
@@ -192,15 +196,21 @@ class VarSpecAccess():  # pylint: disable=too-few-public-methods
         The meta configuration instance to get default values from.
     """
 
+    __slots__ = ("var_spec", "meta_config")
+
     def __init__(self, var_spec: VarSpec, meta_config: MetaConfig):
         self.var_spec = var_spec
         self.meta_config = meta_config
 
     def __getattribute__(self, attr):
+        # Get the variable spec directly, going through this method again for it is slow.
+        var_spec = object.__getattribute__(self, "var_spec")
         if attr == "privacy":
-            if self.var_spec.privacy is None:
-                return self.meta_config.privacy
-            return self.var_spec.privacy
-        if attr not in ("var_spec", "meta_config") and hasattr(self.var_spec, attr):
-            return getattr(self.var_spec, attr)
+            if var_spec.privacy is None:
+                return object.__getattribute__(self, "meta_config").privacy
+            return var_spec.privacy
+        if attr not in ("var_spec", "meta_config"):
+            value = getattr(var_spec, attr, _MISSING)
+            if value is not _MISSING:
+                return value
         return super().__getattribute__(attr)
@@ -19,7 +19,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from copy import deepcopy
-from typing import Optional, Union
+from functools import lru_cache
+from typing import ClassVar, Optional, Union
 
 import numpy as np
 import polars as pl
@@ -52,6 +53,16 @@ class BaseDistribution(ABC):
     """Whether the distribution creates only unique values"""
     version: str = "1.0"
     """Version of the implemented distribution"""
+    _schema: ClassVar[dict]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A subclass that overrides draw, but inherits a vectorized draw_batch, should
+        # still have its own draw method called for every value.
+        draw_owner = next(base for base in cls.__mro__ if "draw" in base.__dict__)
+        batch_owner = next(base for base in cls.__mro__ if "draw_batch" in base.__dict__)
+        if cls.__mro__.index(draw_owner) < cls.__mro__.index(batch_owner):
+            cls.draw_batch = BaseDistribution.draw_batch  # type: ignore
 
     @classmethod
     def fit(cls, series: Union[pl.Series, npt.NDArray],
@@ -78,9 +89,12 @@ class BaseDistribution(ABC):
         if not isinstance(values, (pl.Series, np.ndarray)):
             values = pl.Series(values)
         if isinstance(values, pl.Series):
+            # Series that were already cleaned are passed on as is.
+            if values.null_count() == 0:
+                return values
             series = values.drop_nulls()
         else:
-            series_array = np.array(values)
+            series_array = np.asarray(values)
             series_array = series_array[~np.isnan(series_array)]
             series = pl.Series(series_array)
         return series
@@ -94,6 +108,26 @@ class BaseDistribution(ABC):
     def draw(self) -> object:
         """Draw a random element from the fitted distribution."""
 
+    def draw_batch(self, n: int) -> Union[list, npt.NDArray]:
+        """Draw multiple random elements from the fitted distribution.
+
+        Distributions that can draw their values in a vectorized way should
+        override this method, by default ``draw`` is called n times. Subclasses
+        that override ``draw`` but not this method also fall back to calling
+        ``draw`` n times.
+
+        Parameters
+        ----------
+        n:
+            Number of elements to draw.
+
+        Returns
+        -------
+        list or numpy.ndarray:
+            The drawn elements.
+        """
+        return [self.draw() for _ in range(n)]
+
     def draw_reset(self) -> None:
         """Reset the drawing of elements to start again."""
 
@@ -136,6 +170,14 @@ class BaseDistribution(ABC):
     @classmethod
     def schema(cls) -> dict:
         """Create sub-schema to validate GMF file."""
+        # The schema only depends on the class, so it is created once per class.
+        # Look in the class dictionary, so that subclasses do not get the schema of their parent.
+        if "_schema" not in cls.__dict__:
+            cls._schema = cls._create_schema()
+        return deepcopy(cls._schema)
+
+    @classmethod
+    def _create_schema(cls) -> dict:
         return {
             "type": "object",
             "properties": {
@@ -182,11 +224,14 @@ class BaseDistribution(ABC):
         bool:
             Whether the name matches.
         """
+        return name in cls._all_names()
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _all_names(cls) -> tuple[str, ...]:
+        """Get all names that the distribution can be referred to by (cached per class)."""
         assert cls.implements != "unknown", f"Internal error in class {cls.__name__}"
-        return name in (cls.implements.split(".")[1],
-                        cls.implements,
-                        cls.__name__,
-                        )
+        return (cls.implements.split(".")[1], cls.implements, cls.__name__)
 
     @classmethod
     @abstractmethod
@@ -309,6 +354,9 @@ class ScipyDistribution(BaseDistribution):
     def draw(self):
         return self.dist.rvs()
 
+    def draw_batch(self, n):
+        return self.dist.rvs(size=n)
+
     def information_criterion(self, values):
         vals = self._to_series(values)
         if len(vals) == 0:
@@ -350,6 +398,10 @@ class UniqueDistributionMixin(BaseDistribution):
             n_retry += 1
         raise ValueError(f"Failed to draw unique string after {n_retry} tries.")
 
+    def draw_batch(self, n):
+        # Every value has to be checked against the values drawn before.
+        return [self.draw() for _ in range(n)]
+
     def information_criterion(self, values):
         return 9999999
 
@@ -386,6 +438,9 @@ class BaseConstantDistribution(BaseDistribution):
     def draw(self):
         return self.value
 
+    def draw_batch(self, n):
+        return [self.value] * n
+
     def information_criterion(self, values):
         vals = self._to_series(values)
         return -inf if vals.n_unique() < 2 else inf
@@ -12,6 +12,20 @@ import polars as pl
 from metasyn.distribution.base import BaseDistribution, metadist
 
 
+def _unique_counts(series: pl.Series) -> tuple[npt.NDArray, npt.NDArray[np.int_]]:
+    """Get the sorted unique values of a series and how often they occur.
+
+    This gives the same result as ``np.unique(series, return_counts=True)``, but
+    counts with a hash table instead of sorting all values.
+    """
+    if series.dtype in (pl.Categorical, pl.Enum):
+        series = series.cast(pl.String)
+    # Rename the series, so that its name cannot clash with the count column.
+    value_counts = series.alias("values").value_counts().sort("values")
+    labels = np.array(value_counts["values"].to_list())
+    return labels, value_counts["count"].cast(pl.Int64).to_numpy()
+
+
 @metadist(implements="core.multinoulli", var_type=["categorical", "discrete", "string"])
 class MultinoulliDistribution(BaseDistribution):
     """Categorical distribution using labels and probabilities.
@@ -47,14 +61,14 @@ class MultinoulliDistribution(BaseDistribution):
             raise ValueError("Cannot create multinoulli distribution with probabilities < 0.")
 
         if not np.isclose(np.sum(self.probs), 1):
-            warnings.simplefilter("always")
+            # No warning filters are changed here, since that is not thread safe.
             warnings.warn("Multinoulli probabilities do not add up to 1 "
-                          f" ({np.sum(self.probs)}); they will be rescaled.")
+                          f" ({np.sum(self.probs)}); they will be rescaled.", stacklevel=2)
         self.probs = self.probs/np.sum(self.probs)
 
     @classmethod
     def _fit(cls, values: pl.Series):
-        labels, counts = np.unique(values, return_counts=True)
+        labels, counts = _unique_counts(values)
         probs = counts/np.sum(counts)
         return cls(labels, probs)
 
@@ -71,11 +85,14 @@ class MultinoulliDistribution(BaseDistribution):
     def draw(self):
         return np.random.choice(self.labels, p=self.probs)
 
+    def draw_batch(self, n):
+        return np.random.choice(self.labels, p=self.probs, size=n)
+
     def information_criterion(self,
                               values: Union[pl.Series, npt.NDArray]
                               ) -> float:
         series = self._to_series(values)
-        labels, counts = np.unique(series, return_counts=True)
+        labels, counts = _unique_counts(series)
         log_lik = 0.0
         pdict = dict(zip(self.labels, self.probs))
         # Check type of variable and act accordingly.
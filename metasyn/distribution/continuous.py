@@ -43,7 +43,7 @@ class UniformDistribution(ScipyDistribution):
         return cls(values.min(), values.max())
 
     def _information_criterion(self, values):
-        if np.any(np.array(values) < self.lower) or np.any(np.array(values) > self.upper):
+        if values.min() < self.lower or values.max() > self.upper:
             return np.log(len(values))*self.n_par + 100*len(values)
         if np.fabs(self.upper-self.lower) < 1e-8:
             return np.log(len(values))*self.n_par - 100*len(values)
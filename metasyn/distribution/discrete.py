@@ -81,6 +81,9 @@ class DiscreteNormalDistribution(NormalDistribution):
     def draw(self):
         return int(super().draw())
 
+    def draw_batch(self, n):
+        return super().draw_batch(n).astype(int)
+
 @metadist(implements="core.truncated_normal", var_type="discrete")
 class DiscreteTruncatedNormalDistribution(TruncatedNormalDistribution):
     """Truncated normal discrete distribution.
@@ -104,6 +107,9 @@ class DiscreteTruncatedNormalDistribution(TruncatedNormalDistribution):
     def draw(self):
         return int(super().draw())
 
+    def draw_batch(self, n):
+        return super().draw_batch(n).astype(int)
+
 
 @metadist(implements="core.poisson", var_type="discrete")
 class PoissonDistribution(ScipyDistribution):
@@ -178,6 +184,10 @@ class UniqueKeyDistribution(ScipyDistribution):
         self.last_key = self.lower - 1
         self.key_set = set()
 
+    def draw_batch(self, n):
+        # Keys depend on the keys drawn before, so draw them one by one.
+        return [self.draw() for _ in range(n)]
+
     def draw(self):
         if self.consecutive == 1:
             self.last_key += 1
@@ -194,7 +204,7 @@ class UniqueKeyDistribution(ScipyDistribution):
             return 2*np.log(len(values))+999*len(values)
 
         # If the values are not unique the fit is extremely bad.
-        if len(set(values)) != len(values):
+        if values.n_unique() != len(values):
             return 2*np.log(len(values))+999*len(values)
 
         lower = values.min()
@@ -24,6 +24,9 @@ class NADistribution(BaseDistribution):
     def draw(self):
         return None
 
+    def draw_batch(self, n):
+        return [None] * n
+
     def _param_dict(self):
         return {}
 
@@ -1,11 +1,10 @@
 """Module all string distributions."""
 from __future__ import annotations
 
-from typing import Iterable, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
 # from lingua._constant import LETTERS, PUNCTUATION
 import regex
-from faker import Faker
 from lingua import LanguageDetectorBuilder  # pylint: disable=no-name-in-module
 from regexmodel import NotFittedError, RegexModel
 from scipy.stats import poisson
@@ -17,9 +16,19 @@ from metasyn.distribution.base import (
     metadist,
 )
 
+if TYPE_CHECKING:
+    from faker import Faker
+
 LETTERS = regex.compile(r"\p{Han}|\p{Hangul}|\p{Hiragana}|\p{Katakana}|\p{L}+")
 PUNCTUATION = regex.compile(r"\p{P}")
 
+
+def _create_faker(locale: str) -> Faker:
+    # Faker is slow to import, so only import it once a faker instance is needed.
+    from faker import Faker  # pylint: disable=import-outside-toplevel,redefined-outer-name
+    return Faker(locale=locale)
+
+
 @metadist(implements="core.faker", var_type="string")
 class FakerDistribution(BaseDistribution):
     """Faker distribution for cities, addresses, etc.
@@ -45,7 +54,7 @@ class FakerDistribution(BaseDistribution):
     def __init__(self, faker_type: str, locale: str = "en_US"):
         self.faker_type: str = faker_type
         self.locale: str = locale
-        self.fake: Faker = Faker(locale=locale)
+        self.fake: Faker = _create_faker(locale)
 
     @classmethod
     def _fit(cls, values, faker_type: str = "city", locale: str = "en_US"):  \
@@ -108,7 +117,7 @@ class FreeTextDistribution(BaseDistribution):
         self.locale: str = locale
         self.avg_sentences = avg_sentences
         self.avg_words = avg_words
-        self.fake = Faker(locale=self.locale)
+        self.fake = _create_faker(self.locale)
 
     @classmethod
     def _fit(cls, values, max_values: int = 50):
@@ -118,7 +127,7 @@ class FreeTextDistribution(BaseDistribution):
             return cls.default_distribution()
 
         try:
-            Faker(lang_str)
+            _create_faker(lang_str)
         except AttributeError:
             lang_str = "EN"
 
@@ -14,6 +14,7 @@ from tqdm import tqdm
 
 from metasyn.config import MetaConfig
 from metasyn.privacy import BasePrivacy
+from metasyn.provider import DistributionProviderList
 from metasyn.validation import validate_gmf_dict
 from metasyn.var import MetaVar
 from metasyn.varspec import VarSpec
@@ -119,14 +120,19 @@ class MetaFrame():
         all_vars = []
         columns = df.columns if df is not None else []
         if df is not None:
+            # Count the missing values of all columns at once.
+            null_counts = dict(zip(columns, df.null_count().row(0))) if len(df) > 0 else {}
             for col_name in tqdm(columns, disable=not progress_bar):
                 var_spec = meta_config.get(col_name)
+                prop_missing = var_spec.prop_missing
+                if prop_missing is None and col_name in null_counts:
+                    prop_missing = null_counts[col_name] / len(df)
                 var = MetaVar.fit(
                     df[col_name],
                     var_spec.dist_spec,
                     meta_config.dist_providers,
                     var_spec.privacy,
-                    var_spec.prop_missing,
+                    prop_missing,
                     var_spec.description)
                 all_vars.append(var)
 
@@ -292,7 +298,9 @@ class MetaFrame():
             validate_gmf_dict(self_dict)
 
         n_rows = self_dict["n_rows"]
-        meta_vars = [MetaVar.from_dict(d) for d in self_dict["vars"]]
+        # Share the providers, so that distributions are only indexed once for all variables.
+        provider_list = DistributionProviderList(None)
+        meta_vars = [MetaVar.from_dict(d, provider_list) for d in self_dict["vars"]]
         return cls(meta_vars, n_rows)
 
     def synthesize(self, n: Optional[int] = None) -> pl.DataFrame:
@@ -1,11 +1,14 @@
 """Module with privacy classes to be used for creating GMF files."""
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional, Type, Union
 
 try:
-    from importlib_metadata import entry_points
+    from importlib_metadata import EntryPoint, entry_points
 except ImportError:
-    from importlib.metadata import entry_points  # type: ignore
+    from importlib.metadata import EntryPoint, entry_points  # type: ignore
 
 from metasyn.distribution.base import BaseDistribution
 from metasyn.util import get_registry
@@ -86,9 +89,9 @@ def get_privacy(name: str, parameters: Optional[dict] = None) -> BasePrivacy:
         If the name of the privacy type cannot be found.
     """
     parameters = parameters if parameters is not None else {}
-    for entry in entry_points(group="metasyn.privacy"):
-        if name == entry.name:
-            return entry.load()(**parameters)
+    all_privacy = _get_all_privacy()
+    if name in all_privacy:
+        return all_privacy[name].load()(**parameters)
 
     # Handle case where the plugin is not installed or is misspelled.
     registry = get_registry()
@@ -97,7 +100,7 @@ def get_privacy(name: str, parameters: Optional[dict] = None) -> BasePrivacy:
         avail = "\n".join(f"{key}: {val['url']}" for key, val in available_plugins.items())
         raise ImportError(f"No plugin is installed that provides '{name}' privacy. "
                           f"Available plugins that provide '{name}' privacy:\n\n{avail}")
-    privacy_names = [entry.name for entry in entry_points(group="metasyn.privacy")]
+    privacy_names = list(all_privacy)
     avail = "\n".join(f"<{key}> provides: {val['privacy']}\n\t{val['url']}"
                       for key, val in registry.items() if len(val['privacy']) > 0)
     raise ImportError(f"Unknown privacy type with name '{name}'. "
@@ -105,3 +108,15 @@ def get_privacy(name: str, parameters: Optional[dict] = None) -> BasePrivacy:
                        " (and not misspelled it).\n"
                       f"Installed privacy types: {privacy_names}.\n\n"
                       f"List of plugins that provide privacy:\n\n{avail}\n")
+
+
+@lru_cache(maxsize=1)
+def _get_all_privacy() -> dict[str, EntryPoint]:
+    """Get the entry points of all installed privacy types.
+
+    The entry points are only scanned once, use ``provider._clear_provider_cache`` to rescan them.
+    """
+    return {
+        entry.name: entry
+        for entry in entry_points(group="metasyn.privacy")
+    }
@@ -6,8 +6,11 @@ See pyproject.toml on how the builtin distribution provider is registered.
 
 from __future__ import annotations
 
+import os
 import warnings
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, Any, List, Optional, Type, Union
 
 try:
@@ -15,7 +18,6 @@ try:
 except ImportError:
     from importlib.metadata import EntryPoint, entry_points  # type: ignore
 
-import numpy as np
 import polars as pl
 
 from metasyn.distribution.base import BaseDistribution
@@ -53,13 +55,19 @@ from metasyn.distribution.string import (
     UniqueFakerDistribution,
     UniqueRegexDistribution,
 )
-from metasyn.privacy import BasePrivacy, BasicPrivacy
+from metasyn.privacy import BasePrivacy, BasicPrivacy, _get_all_privacy
 from metasyn.util import get_registry
 from metasyn.varspec import DistributionSpec
 
 if TYPE_CHECKING:
     from metasyn.config import VarSpec, VarSpecAccess
 
+# Minimum length of a series for the distributions to be fitted in parallel.
+_PARALLEL_FIT_MIN_LENGTH = 10_000
+
+# All names that refer to the NA distribution.
+_NA_NAMES = frozenset(NADistribution._all_names())  # pylint: disable=protected-access
+
 
 class BaseDistributionProvider(ABC):
     """Base class for all distribution providers.
@@ -74,8 +82,8 @@ class BaseDistributionProvider(ABC):
 
     name = ""
     version = ""
-    distributions: list[type[BaseDistribution]] = []
-    legacy_distributions: list[type[BaseDistribution]] = []
+    distributions: tuple[type[BaseDistribution], ...] = ()
+    legacy_distributions: tuple[type[BaseDistribution], ...] = ()
 
     def __init__(self):
         # Perform internal consistency check.
@@ -102,22 +110,25 @@ class BaseDistributionProvider(ABC):
         list[Type[BaseDistribution]]:
             List of distributions with that variable type.
         """
-        dist_list = []
         if use_legacy:
             distributions = self.legacy_distributions
         else:
             distributions = self.distributions
-        distributions = [d for d in distributions if d.unique == unique]
-        if var_type is None:
-            return distributions
+        # Filter on uniqueness and variable type in a single pass.
+        dist_list = []
         for dist_class in distributions:
-            str_chk = (isinstance(dist_class.var_type, str) and var_type == dist_class.var_type)
-            lst_chk = (not isinstance(dist_class.var_type, str) and var_type in dist_class.var_type)
-            if str_chk or lst_chk:
+            if dist_class.unique != unique:
+                continue
+            if var_type is None:
+                dist_list.append(dist_class)
+            elif isinstance(dist_class.var_type, str):
+                if var_type == dist_class.var_type:
+                    dist_list.append(dist_class)
+            elif var_type in dist_class.var_type:
                 dist_list.append(dist_class)
         return dist_list
 
-    @property
+    @cached_property
     def all_var_types(self) -> List[str]:
         """Return list of available variable types."""
         var_type_set = set()
@@ -138,7 +149,7 @@ class BuiltinDistributionProvider(BaseDistributionProvider):
 
     name = "builtin"
     version = "1.2"
-    distributions = [
+    distributions = (
         DiscreteNormalDistribution, DiscreteTruncatedNormalDistribution,
         DiscreteUniformDistribution, PoissonDistribution, UniqueKeyDistribution,
         UniformDistribution, NormalDistribution, LogNormalDistribution,
@@ -155,8 +166,8 @@ class BuiltinDistributionProvider(BaseDistributionProvider):
         DateTimeConstantDistribution,
         DateConstantDistribution,
         TimeConstantDistribution,
-    ]
-    legacy_distributions = []
+    )
+    legacy_distributions = ()
 
 
 class DistributionProviderList():
@@ -184,6 +195,10 @@ class DistributionProviderList():
                 list[str],
                 None, str, type[BaseDistributionProvider], BaseDistributionProvider,
                 list[Union[str, type[BaseDistributionProvider], BaseDistributionProvider]]]):
+        # Filtered distribution lists, see get_distributions.
+        self._dist_cache: dict[tuple, tuple[type[BaseDistribution], ...]] = {}
+        # Index from names to distributions, see _find_by_name.
+        self._name_cache: dict[tuple, dict[str, list[type[BaseDistribution]]]] = {}
         if dist_providers is None:
             self.dist_packages = _get_all_provider_list()
             return
@@ -270,21 +285,23 @@ class DistributionProviderList():
         BaseDistribution:
             Distribution fitted to the series.
         """
-        if len(series.drop_nulls()) == 0:
+        if series.null_count() == len(series):
             return NADistribution()
+        # Drop the missing values once, instead of in every candidate distribution.
+        if series.null_count() > 0:
+            series = series.drop_nulls()
         try_unique = unique if unique is True else False
         dist_list = self.get_distributions(privacy, var_type, unique=try_unique)
         if len(dist_list) == 0:
             raise ValueError(f"No available distributions with variable type: '{var_type}'"
                              f" and unique={try_unique}")
-        dist_instances = [d.fit(series, **privacy.fit_kwargs) for d in dist_list]
-        dist_bic = [d.information_criterion(series) for d in dist_instances]
+        best_dist, best_ic = _fit_best_distribution(dist_list, series, privacy.fit_kwargs)
         if unique is None:
             dist_list_unq = self.get_distributions(privacy, var_type, unique=True)
             if len(dist_list_unq) > 0:
-                dist_inst_unq = [d.fit(series, **privacy.fit_kwargs) for d in dist_list_unq]
-                dist_bic_unq = [d.information_criterion(series) for d in dist_inst_unq]
-                if np.min(dist_bic_unq) < np.min(dist_bic):
+                _, best_ic_unq = _fit_best_distribution(dist_list_unq, series,
+                                                        privacy.fit_kwargs)
+                if best_ic_unq < best_ic:
                     warnings.warn(
                         f"\nVariable '{series.name}' was detected to be unique, but has not"
                         f" explicitly been set to unique.\n"
@@ -294,7 +311,7 @@ class DistributionProviderList():
                         UserWarning
                     )
 
-        return dist_instances[np.argmin(dist_bic)]
+        return best_dist
 
     def find_distribution(self,  # pylint: disable=too-many-branches
                           dist_name: str,
@@ -324,19 +341,16 @@ class DistributionProviderList():
         tuple[Type[BaseDistribution], dict[str, Any]]:
             A distribution and the arguments to create an instance.
         """
-        if NADistribution.matches_name(dist_name):
+        if dist_name in _NA_NAMES:
             return NADistribution
 
         versions_found = []
-        for dist_class in self.get_distributions(
-                privacy, var_type=var_type, unique=unique) + [NADistribution]:
-            if dist_class.matches_name(dist_name):
-                if version is None or version == dist_class.version:
-                    return dist_class
-                versions_found.append(dist_class)
+        for dist_class in self._find_by_name(dist_name, privacy, var_type, unique):
+            if version is None or version == dist_class.version:
+                return dist_class
+            versions_found.append(dist_class)
 
         # Look for distribution in legacy
-        warnings.simplefilter("always")
         legacy_distribs = [
             dist_class
             for dist_class in self.get_distributions(privacy, use_legacy=True,
@@ -350,7 +364,7 @@ class DistributionProviderList():
                 if dist_name in meta["distributions"]:
                     available[plugin] = meta["url"]
             if len(available) > 0:
-                avail_str = "\n".join("{plugin}: {url}" for plugin, url in available.items())
+                avail_str = "\n".join(f"{plugin}: {url}" for plugin, url in available.items())
                 raise ValueError(f"You are trying to use a distribution named '{dist_name}', \n"
                                  f"but it is not installed.\n"
                                  f"\n"
@@ -358,22 +372,22 @@ class DistributionProviderList():
             raise ValueError(f"Cannot find distribution with name '{dist_name}'.")
 
         if len(versions_found) == 0:
-            warnings.warn("Distribution with name '{dist_name}' is deprecated and "
-                          "will be removed in the future.")
+            _warn_always(f"Distribution with name '{dist_name}' is deprecated and "
+                         "will be removed in the future.")
 
         # Find exact matches in legacy distributions
         legacy_versions = [dist.version for dist in legacy_distribs]
         if version is not None and version in legacy_versions:
-            warnings.warn("Version ({version}) of distribution with name '{dist_name}'"
-                          " is deprecated and will be removed in the future.")
+            _warn_always(f"Version ({version}) of distribution with name '{dist_name}'"
+                         " is deprecated and will be removed in the future.")
             return legacy_distribs[legacy_versions.index(version)]
 
         # If version is None, take the latest version.
         if version is None:
             scores = [int(dist.version.split(".")[0]) * 100 + int(dist.version.split(".")[1])
                       for dist in legacy_distribs]
-            i_min = np.argmax(scores)
-            return legacy_distribs[i_min]
+            i_max = max(range(len(scores)), key=scores.__getitem__)
+            return legacy_distribs[i_max]
 
         # Find the distribution with the same major revision, and closest minor revision.
         major_version = int(version.split(".")[0])
@@ -382,7 +396,7 @@ class DistributionProviderList():
         all_versions = [[int(x) for x in dist.version.split(".")] for dist in all_dist]
         score = [int(ver[0] == major_version) * 1000000 - (ver[1] - minor_version) ** 2
                  for ver in all_versions]
-        i_max = np.argmax(score)
+        i_max = max(range(len(score)), key=score.__getitem__)
 
         # Wrong major revision.
         if score[i_max] < 500000:
@@ -390,9 +404,33 @@ class DistributionProviderList():
                 f"Cannot find compatible version for distribution '{dist_name}', available: "
                 f"{legacy_versions + versions_found}")
 
-        warnings.warn("Version mismatch ({version}) versus ({all_dist[i_max].version}))")
+        _warn_always(f"Version mismatch ({version}) versus ({all_dist[i_max].version})")
         return all_dist[i_max]
 
+    def _find_by_name(self, dist_name: str, privacy: Optional[BasePrivacy],
+                      var_type: Optional[str], unique: bool) -> list[type[BaseDistribution]]:
+        """Find the (non-legacy) distributions that match a name, in order of precedence.
+
+        An index from names to distributions is created once for every combination of
+        privacy, variable type and uniqueness.
+        """
+        privacy_name = None if privacy is None else privacy.name
+        cache_key = (privacy_name, var_type, unique)
+        if cache_key not in self._name_cache:
+            name_index: dict[str, list[type[BaseDistribution]]] = {}
+            for dist_class in self.get_distributions(privacy, var_type=var_type, unique=unique):
+                for name in dict.fromkeys(dist_class._all_names()):  # pylint: disable=protected-access
+                    name_index.setdefault(name, []).append(dist_class)
+            self._name_cache[cache_key] = name_index
+        name_index = self._name_cache[cache_key]
+        if dist_name in name_index:
+            return name_index[dist_name]
+
+        # Distributions can override matches_name to accept names that are not in the index.
+        return [dist_class
+                for dist_class in self.get_distributions(privacy, var_type=var_type, unique=unique)
+                if dist_class.matches_name(dist_name)]
+
     def _fit_distribution(self, series: pl.Series,
                           dist_spec: DistributionSpec,
                           var_type: str,
@@ -458,15 +496,17 @@ class DistributionProviderList():
         dist_list:
             List of distributions that fit the given constraints.
         """
-        dist_list = []
-        for dist_provider in self.dist_packages:
-            dist_list.extend(dist_provider.get_dist_list(
-                var_type, use_legacy=use_legacy, unique=unique))
-
-        if privacy is None:
-            return dist_list
-        dist_list = [dist for dist in dist_list if dist.privacy == privacy.name]
-        return dist_list
+        privacy_name = None if privacy is None else privacy.name
+        cache_key = (privacy_name, var_type, unique, use_legacy)
+        if cache_key not in self._dist_cache:
+            dist_list = []
+            for dist_provider in self.dist_packages:
+                dist_list.extend(dist_provider.get_dist_list(
+                    var_type, use_legacy=use_legacy, unique=unique))
+            if privacy_name is not None:
+                dist_list = [dist for dist in dist_list if dist.privacy == privacy_name]
+            self._dist_cache[cache_key] = tuple(dist_list)
+        return list(self._dist_cache[cache_key])
 
     def from_dict(self, var_dict: dict[str, Any]) -> BaseDistribution:
         """Create a distribution from a dictionary.
@@ -490,16 +530,94 @@ class DistributionProviderList():
         return dist_class.from_dict(var_dict["distribution"])
 
 
+def _warn_always(message: str):
+    # Scope the filter, so that the global warning configuration is left untouched.
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        warnings.warn(message)
+
+
+def _fit_and_score(dist_class: type[BaseDistribution], series: pl.Series,
+                   fit_kwargs: dict) -> tuple[BaseDistribution, float]:
+    dist = dist_class.fit(series, **fit_kwargs)
+    return dist, dist.information_criterion(series)
+
+
+def _fit_best_distribution(dist_list: list[type[BaseDistribution]], series: pl.Series,
+                           fit_kwargs: dict) -> tuple[BaseDistribution, float]:
+    """Fit all distributions and return the one with the lowest information criterion.
+
+    If the environment variable METASYN_PARALLEL_FIT is set (and not "0"), the distributions
+    are fitted concurrently in a thread pool. This is only done for series with at least
+    ``_PARALLEL_FIT_MIN_LENGTH`` values, since for short series the overhead of the pool
+    outweighs the gain.
+
+    Parameters
+    ----------
+    dist_list:
+        Distributions to fit, should contain at least one distribution.
+    series:
+        Series to fit the distributions to, without missing values.
+    fit_kwargs:
+        Keyword arguments that are passed to the fit method of each distribution.
+
+    Returns
+    -------
+    tuple[BaseDistribution, float]:
+        The best fitting distribution and its information criterion.
+    """
+    if (len(dist_list) > 1 and len(series) >= _PARALLEL_FIT_MIN_LENGTH
+            and os.environ.get("METASYN_PARALLEL_FIT", "0") not in ("", "0")):
+        n_workers = min(len(dist_list), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(
+                lambda dist_class: _fit_and_score(dist_class, series, fit_kwargs), dist_list))
+    else:
+        results = [_fit_and_score(dist_class, series, fit_kwargs) for dist_class in dist_list]
+
+    best_dist, best_ic = None, 0.0
+    for dist, info_crit in results:
+        if best_dist is None or info_crit < best_ic:
+            best_dist, best_ic = dist, info_crit
+    assert best_dist is not None
+    return best_dist, best_ic
+
+
+@lru_cache(maxsize=1)
 def _get_all_providers() -> dict[str, EntryPoint]:
-    """Get all available providers."""
+    """Get all available providers.
+
+    The entry points are only scanned once, use ``_clear_provider_cache`` to rescan them.
+    """
     return {
         entry.name: entry
         for entry in entry_points(group="metasyn.distribution_provider")
     }
 
 
+@lru_cache(maxsize=1)
+def _get_all_provider_instances() -> tuple[BaseDistributionProvider, ...]:
+    return tuple(p.load()() for p in _get_all_providers().values())
+
+
 def _get_all_provider_list() -> list[BaseDistributionProvider]:
-    return [p.load()() for p in _get_all_providers().values()]
+    return list(_get_all_provider_instances())
+
+
+@lru_cache(maxsize=None)
+def _get_named_provider(name: str) -> BaseDistributionProvider:
+    return _get_all_providers()[name].load()()
+
+
+def _clear_provider_cache() -> None:
+    """Clear the cached providers and privacy types.
+
+    Use this for example after a plugin has been installed.
+    """
+    _get_all_providers.cache_clear()
+    _get_all_privacy.cache_clear()
+    _get_all_provider_instances.cache_clear()
+    _get_named_provider.cache_clear()
 
 
 def get_distribution_provider(provider: Union[str, type[
@@ -525,9 +643,8 @@ def get_distribution_provider(provider: Union[str, type[
     if isinstance(provider, type):
         return provider()
 
-    all_providers = _get_all_providers()
     try:
-        return all_providers[provider].load()()
+        return _get_named_provider(provider)
     except KeyError as exc:
         registry = get_registry()
         if provider not in registry:
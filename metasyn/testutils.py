@@ -7,6 +7,8 @@ and internal consistency of individual distributions and providers.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import jsonschema
 import polars as pl
 from jsonschema.exceptions import SchemaError
@@ -53,13 +55,9 @@ def check_distribution(distribution: type[BaseDistribution], privacy: BasePrivac
     provenance:
         Which provider/plugin/package provides the distribution.
     """
-    # Check the schema of the distribution.
-    schema = distribution.schema()
-    dist_dict = distribution.default_distribution().to_dict()
-    try:
-        jsonschema.validate(_jsonify(dist_dict), schema)
-    except SchemaError as err:
-        raise ValueError(f"Failed distribution validation for {distribution.__name__}") from err
+    # Check the schema of the distribution, the default distribution is also used for drawing.
+    dist = distribution.default_distribution()
+    _validator_for(distribution).validate(_jsonify(dist.to_dict()))
 
     # Check the privacy
     assert privacy.is_compatible(distribution)
@@ -67,17 +65,28 @@ def check_distribution(distribution: type[BaseDistribution], privacy: BasePrivac
         var_types = [distribution.var_type]
     else:
         var_types = distribution.var_type
+    provider_list = DistributionProviderList(provenance)
     for vt in var_types:
-        DistributionProviderList(provenance).find_distribution(
+        provider_list.find_distribution(
             distribution.implements, var_type=vt, privacy=privacy,
             unique=distribution.unique)
 
     assert len(distribution.implements.split(".")) == 2
     assert distribution.provenance == provenance
     assert distribution.var_type != "unknown"
-    dist = distribution.default_distribution()
-    series = pl.Series([dist.draw() for _ in range(100)])
+    series = pl.Series(dist.draw_batch(100))
     new_dist = distribution.fit(series, **privacy.fit_kwargs)
     assert isinstance(new_dist, distribution)
-    assert set(list(new_dist.to_dict())) >= set(
-        ("implements", "provenance", "class_name", "parameters"))
+    assert new_dist.to_dict().keys() >= {"implements", "provenance", "class_name", "parameters"}
+
+
+@lru_cache(maxsize=None)
+def _validator_for(distribution: type[BaseDistribution]) -> jsonschema.protocols.Validator:
+    """Create a validator for the schema of a distribution, once per distribution class."""
+    schema = distribution.schema()
+    validator_class = jsonschema.validators.validator_for(schema)
+    try:
+        validator_class.check_schema(schema)
+    except SchemaError as err:
+        raise ValueError(f"Failed distribution validation for {distribution.__name__}") from err
+    return validator_class(schema)
@@ -6,16 +6,13 @@ This ensures that the Generative Metadata Format (GMF) files are interoperable a
 from __future__ import annotations
 
 from copy import deepcopy
-
-try:
-    from importlib_metadata import entry_points
-except ImportError:
-    from importlib.metadata import entry_points  # type: ignore
+from functools import lru_cache
+from typing import Iterable
 
 import jsonschema
 
 from metasyn.distribution.na import NADistribution
-from metasyn.provider import get_distribution_provider
+from metasyn.provider import _get_all_providers, get_distribution_provider
 
 SCHEMA_BASE = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
@@ -66,31 +63,68 @@ def validate_gmf_dict(gmf_dict: dict):
     gmf_dict:
         Dictionary containing the metasyn output for a metaframe.
     """
-    packages = [entry.name for entry in entry_points(group="metasyn.distribution_provider")]
-    schema = create_schema(packages)
-    jsonschema.validate(gmf_dict, schema)
+    # The installed providers are only scanned once, see provider._get_all_providers.
+    validator = _create_validator(tuple(sorted(_get_all_providers())))
+    # Raise the most relevant error, as jsonschema.validate does.
+    error = jsonschema.exceptions.best_match(validator.iter_errors(gmf_dict))
+    if error is not None:
+        raise error
 
 
-def create_schema(packages: list[str]) -> dict:
+def create_schema(packages: Iterable[str]) -> dict:
     """Create JSON Schema to validate a GMF file.
 
     Arguments
     ---------
     packages:
-        List of packages to create the schema with.
+        Packages to create the schema with.
 
     Returns
     -------
     schema:
         Schema containing all the distributions in the distribution packages.
     """
+    schema = deepcopy(SCHEMA_BASE)
+    schema["$defs"] = {"all_dist_def": {"anyOf": _dist_defs(packages)}}
+    return schema
+
+
+@lru_cache(maxsize=8)
+def _create_validator(packages: tuple[str, ...]) -> jsonschema.protocols.Validator:
+    schema = _inline_dist_defs(_create_schema(packages))
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def _inline_dist_defs(schema: dict) -> dict:
+    """Replace the reference to the distribution definitions by the definitions themselves.
+
+    This saves resolving the reference for every variable during validation. The schema
+    itself is left untouched, since its nested parts are shared with SCHEMA_BASE.
+    """
+    var_schema = schema["properties"]["vars"]["items"]
+    var_schema = {
+        **var_schema,
+        "properties": {**var_schema["properties"],
+                       "distribution": schema["$defs"]["all_dist_def"]},
+    }
+    vars_schema = {**schema["properties"]["vars"], "items": var_schema}
+    return {**schema, "properties": {**schema["properties"], "vars": vars_schema}}
+
+
+@lru_cache(maxsize=8)
+def _create_schema(packages: tuple[str, ...]) -> dict:
+    # The cached schema is only used by the validator and is never modified, so only the
+    # top level gets a new key and the nested parts of the base are shared.
+    return {**SCHEMA_BASE, "$defs": {"all_dist_def": {"anyOf": _dist_defs(packages)}}}
+
+
+def _dist_defs(packages: Iterable[str]) -> list[dict]:
     defs: list[dict] = []
     for package_name in packages:
         pkg = get_distribution_provider(package_name)
         for dist in pkg.distributions:
             defs.append(dist.schema())
     defs.append(NADistribution.schema())
-
-    schema = deepcopy(SCHEMA_BASE)
-    schema.update({"$defs": {"all_dist_def": {"anyOf": defs}}})
-    return schema
+    return defs
@@ -12,6 +12,19 @@ from metasyn.privacy import BasePrivacy, BasicPrivacy
 from metasyn.provider import BaseDistributionProvider, DistributionProviderList
 from metasyn.varspec import DistributionSpec
 
+# Python type names of polars dtypes and the variable types they are converted to.
+_POLARS_TO_VAR_TYPE = {
+    "int": "discrete",
+    "float": "continuous",
+    "date": "date",
+    "datetime": "datetime",
+    "time": "time",
+    "str": "string",
+    "categorical": "categorical",
+    "bool": "categorical",
+    "NoneType": "continuous",
+}
+
 
 class MetaVar():
     """Metadata variable describing a column in a MetaFrame.
@@ -50,6 +63,9 @@ class MetaVar():
         it will be assumed to have been created by the user.
     """
 
+    __slots__ = ("name", "var_type", "distribution", "dtype", "description", "prop_missing",
+                 "creation_method")
+
     def __init__(self,  # pylint: disable=too-many-arguments
                  name: str,
                  var_type: str,
@@ -95,22 +111,10 @@ class MetaVar():
         except NotImplementedError:
             polars_dtype = pl.datatypes.dtype_to_ffiname(series.dtype)
 
-        convert_dict = {
-            "int": "discrete",
-            "float": "continuous",
-            "date": "date",
-            "datetime": "datetime",
-            "time": "time",
-            "str": "string",
-            "categorical": "categorical",
-            "bool": "categorical",
-            "NoneType": "continuous",
-        }
-        try:
-            return convert_dict[polars_dtype]
-        except KeyError as exc:
-            raise ValueError(
-                f"Unsupported polars type '{polars_dtype}'") from exc
+        var_type = _POLARS_TO_VAR_TYPE.get(polars_dtype)
+        if var_type is None:
+            raise ValueError(f"Unsupported polars type '{polars_dtype}'")
+        return var_type
 
     def to_dict(self) -> Dict[str, Any]:
         """Create a dictionary from the variable."""
@@ -191,7 +195,8 @@ class MetaVar():
         dist_spec = DistributionSpec.parse(dist_spec)
         distribution = provider_list.fit(series, var_type, dist_spec, privacy)
         if prop_missing is None:
-            prop_missing = (len(series) - len(series.drop_nulls())) / len(series)
+            n_values = len(series)
+            prop_missing = series.null_count() / n_values if n_values > 0 else 0.0
         return cls(series.name, var_type, distribution=distribution, dtype=str(series.dtype),
                    description=description, prop_missing=prop_missing,
                    creation_method=dist_spec.get_creation_method(privacy))
@@ -217,24 +222,40 @@ class MetaVar():
             Polars series with the synthetic data.
         """
         self.distribution.draw_reset()
-        value_list = [self.draw() for _ in range(n)]
-        if "Categorical" in self.dtype:
-            return pl.Series(value_list, dtype=pl.Categorical)
-        return pl.Series(value_list)
+        dtype = pl.Categorical if "Categorical" in self.dtype else None
+        # Without missing values, the drawn values can be used directly.
+        if not self.prop_missing:
+            return pl.Series(self.distribution.draw_batch(n), dtype=dtype)
+        # A series without values has the Null dtype (or Categorical), whatever the distribution.
+        if self.prop_missing >= 1:
+            return pl.Series([], dtype=dtype).extend_constant(None, n)
+
+        missing = np.random.rand(n) < self.prop_missing
+        if missing.all():
+            return pl.Series([], dtype=dtype).extend_constant(None, n)
+        values = pl.Series(self.distribution.draw_batch(n - int(missing.sum())), dtype=dtype)
+        if not missing.any():
+            return values
+
+        # Spread the drawn values over the positions that are not missing.
+        indices = pl.Series(np.cumsum(~missing) - 1).scatter(np.flatnonzero(missing), None)
+        return values.gather(indices)
 
     @classmethod
     def from_dict(cls,
                   var_dict: Dict[str, Any],
                   distribution_providers: Union[
                       None, str, type[BaseDistributionProvider],
-                      BaseDistributionProvider] = None) -> MetaVar:
+                      BaseDistributionProvider, DistributionProviderList] = None) -> MetaVar:
         """Restore variable from dictionary.
 
         Parameters
         ----------
         distribution_providers:
             Distribution providers to use to create the variable. If None,
-            use all installed/available distribution providers.
+            use all installed/available distribution providers. A
+            DistributionProviderList is used as is, so that it can be shared
+            between variables.
         var_dict:
             This dictionary contains all the variable and distribution
             information to recreate it from scratch.
@@ -244,7 +265,10 @@ class MetaVar():
         MetaVar:
             Initialized metadata variable.
         """
-        provider_list = DistributionProviderList(distribution_providers)
+        if isinstance(distribution_providers, DistributionProviderList):
+            provider_list = distribution_providers
+        else:
+            provider_list = DistributionProviderList(distribution_providers)
         dist = provider_list.from_dict(var_dict)
         return cls(
             name=var_dict["name"],
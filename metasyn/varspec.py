@@ -77,7 +77,7 @@ class DistributionSpec():
             return cls(**dist_spec)
         if isinstance(dist_spec, DistributionSpec):
             return dist_spec
-        if issubclass(dist_spec, BaseDistribution):
+        if isinstance(dist_spec, type) and issubclass(dist_spec, BaseDistribution):
             return cls(implements=dist_spec.implements, unique=dist_spec.unique)
         raise TypeError("Error parsing distribution specification of unknown type "
                         f"'{type(dist_spec)}' with value '{dist_spec}'")
@@ -106,9 +106,10 @@ class DistributionSpec():
             Dictionary containing all the non-default settings for the creation method.
         """
         ret_dict: dict[str, Any] = {"created_by": "metasyn"}
-        for var in ["implements", "unique", "parameters", "version"]:
-            if getattr(self, var) is not None:
-                ret_dict[var] = getattr(self, var)
+        for var in ("implements", "unique", "parameters", "version"):
+            value = getattr(self, var)
+            if value is not None:
+                ret_dict[var] = value
         if len(self.fit_kwargs) > 0:
             ret_dict["fit_kwargs"] = self.fit_kwargs
         if not isinstance(privacy, BasicPrivacy):
@@ -155,6 +156,9 @@ class VarSpec():  # pylint: disable=too-few-public-methods
         Manually set the variable type of the columns (used mainly for data_free columns).
     """
 
+    __slots__ = ("name", "dist_spec", "privacy", "prop_missing", "description", "data_free",
+                 "var_type")
+
     def __init__(
             self,
             name: str,
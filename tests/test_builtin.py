@@ -1,9 +1,12 @@
+import polars as pl
 from pytest import mark, raises
 
 from metasyn.distribution import UniformDistribution
+from metasyn.distribution.base import BaseDistribution
 from metasyn.privacy import BasicPrivacy
 from metasyn.provider import get_distribution_provider
 from metasyn.testutils import check_distribution, check_distribution_provider
+from metasyn.var import MetaVar
 
 
 def test_builtin_provider():
@@ -18,6 +21,39 @@ def test_dist_validation(distribution):
                        provenance="builtin")
 
 
+@mark.parametrize(
+    "distribution", get_distribution_provider("builtin").distributions
+)
+def test_draw_batch(distribution):
+    dist = distribution.default_distribution()
+    series = pl.Series([dist.draw() for _ in range(20)])
+    dist.draw_reset()
+    batch = pl.Series(dist.draw_batch(20))
+    assert len(batch) == 20
+    assert batch.dtype == series.dtype
+
+
+class RoundedUniform(UniformDistribution):
+    def draw(self):
+        return round(super().draw())
+
+
+def test_draw_batch_overridden_draw():
+    dist = RoundedUniform(0, 10)
+    assert all(value == round(value) for value in dist.draw_batch(100))
+    var = MetaVar("test", "continuous", dist, prop_missing=0.5)
+    series = var.draw_series(100).drop_nulls()
+    assert (series == series.round()).all()
+    # Distributions that do not override draw keep their vectorized draw_batch.
+    assert UniformDistribution.draw_batch is not BaseDistribution.draw_batch
+
+
+def test_schema_copy():
+    schema = UniformDistribution.schema()
+    schema["properties"]["parameters"]["properties"].clear()
+    assert len(UniformDistribution.schema()["properties"]["parameters"]["properties"]) > 0
+
+
 class Distribution(UniformDistribution):
     def schema():
         return "[{"
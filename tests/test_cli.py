@@ -8,7 +8,7 @@ import polars as pl
 from pytest import fixture, mark
 
 from metasyn import MetaFrame
-from metasyn.validation import validate_gmf_dict
+from metasyn.validation import SCHEMA_BASE, create_schema, validate_gmf_dict
 
 TMP_DIR_PATH = None
 
@@ -133,6 +133,15 @@ def test_schema_gen(tmp_dir):
     assert result.returncode != 0
 
 
+def test_schema_copy():
+    schema = create_schema(["builtin"])
+    schema["required"].append("x")
+    schema["properties"]["vars"]["items"]["properties"].clear()
+    assert "x" not in SCHEMA_BASE["required"]
+    assert "x" not in create_schema(["builtin"])["required"]
+    assert len(SCHEMA_BASE["properties"]["vars"]["items"]["properties"]) > 0
+
+
 def test_datafree(tmp_dir):
     gmf_fp = tmp_dir / "gmf_out.json"
     syn_fp = tmp_dir / "test_out.csv"
@@ -32,6 +32,12 @@ def test_dist_spec(input, error):
         dist_spec = DistributionSpec.parse(input)
         assert isinstance(dist_spec, DistributionSpec)
 
+
+def test_dist_spec_type_error():
+    with pytest.raises(TypeError, match="unknown type"):
+        DistributionSpec.parse(1)
+
+
 def test_var_spec():
     var_spec = VarSpec("test", privacy={"name": "none", "parameters": {}})
     assert var_spec.name == "test"
@@ -1,3 +1,5 @@
+import numpy as np
+import polars as pl
 from pytest import mark, raises
 
 from metasyn.distribution.categorical import MultinoulliDistribution
@@ -34,3 +36,19 @@ def test_util(dist_str, var_type, is_unique, dist):
             provider_list.find_distribution("this is not a distribution", "string")
     new_class = provider_list.find_distribution(dist_class.__name__, var_type=var_type, unique=is_unique)
     assert new_class == dist_class
+
+
+@mark.parametrize(
+    "series",
+    [
+        pl.Series("count", ["b", "a", "c", "a", "é"]),
+        pl.Series([3, 1, 2, 1, 1]),
+        pl.Series(["y", "x", "y"], dtype=pl.Categorical),
+    ]
+)
+def test_multinoulli_fit(series):
+    dist = MultinoulliDistribution.fit(series)
+    labels, counts = np.unique(series.cast(pl.String) if series.dtype == pl.Categorical
+                               else series, return_counts=True)
+    assert list(dist.labels) == list(labels)
+    assert np.allclose(dist.probs, counts/np.sum(counts))
@@ -1,9 +1,17 @@
+import polars as pl
 import pytest
 from pytest import mark
 
 from metasyn.distribution import MultinoulliDistribution, UniformDistribution
 from metasyn.distribution.base import BaseDistribution, metadist
-from metasyn.provider import BuiltinDistributionProvider, DistributionProviderList
+from metasyn.privacy import _get_all_privacy, get_privacy
+from metasyn.provider import (
+    BuiltinDistributionProvider,
+    DistributionProviderList,
+    _clear_provider_cache,
+    get_distribution_provider,
+)
+from metasyn.varspec import DistributionSpec
 
 
 @mark.parametrize("input", ["builtin", "fake-name", BuiltinDistributionProvider,
@@ -45,11 +53,11 @@ class LegacyOnly(BuiltinDistributionProvider):
 def test_legacy():
     plist = DistributionProviderList(CheckProvider)
     assert issubclass(plist.find_distribution("core.uniform", var_type="continuous"), UniformTest2)
-    with pytest.warns():
+    with pytest.warns(match=r"Version \(1.1\) of distribution with name 'core.uniform'"):
         assert issubclass(plist.find_distribution("core.uniform", var_type="continuous", version="1.1"), UniformTest11)
     with pytest.warns():
         assert issubclass(plist.find_distribution("core.uniform", var_type="continuous", version="1.0"), UniformTest1)
-    with pytest.warns():
+    with pytest.warns(match=r"Version mismatch \(1.2\) versus \(1.1\)"):
         assert issubclass(plist.find_distribution("core.uniform", var_type="continuous", version="1.2"), UniformTest11)
     with pytest.raises(ValueError):
         plist.find_distribution("core.uniform", var_type="continuous", version="0.9")
@@ -57,5 +65,33 @@ def test_legacy():
         assert issubclass(plist.find_distribution("core.uniform", var_type="continuous", version="2.1"), UniformTest2)
 
     plist = DistributionProviderList(LegacyOnly)
-    with pytest.warns():
+    with pytest.warns(match="Distribution with name 'core.uniform' is deprecated"):
         assert issubclass(plist.find_distribution("core.uniform", var_type="continuous"), UniformTest2)
+
+
+def test_provider_cache():
+    plist = DistributionProviderList(None)
+    assert len(plist.dist_packages) > 0
+    new_plist = DistributionProviderList(None)
+    assert plist.dist_packages is not new_plist.dist_packages
+    assert all(a is b for a, b in zip(plist.dist_packages, new_plist.dist_packages))
+    get_privacy("none")
+    _clear_provider_cache()
+    assert _get_all_privacy.cache_info().currsize == 0
+    new_plist = DistributionProviderList(None)
+    assert [p.name for p in plist.dist_packages] == [p.name for p in new_plist.dist_packages]
+    assert get_distribution_provider("builtin") is get_distribution_provider("builtin")
+    with pytest.raises(ValueError):
+        get_distribution_provider("unknown_provider")
+
+
+def test_parallel_fit(monkeypatch):
+    series = pl.Series([1, 2, 3, 4, 5, 6, 7, 8, 9, 10] * 10)
+    plist = DistributionProviderList("builtin")
+    monkeypatch.setenv("METASYN_PARALLEL_FIT", "0")
+    serial_dist = plist.fit(series, "discrete", DistributionSpec())
+    monkeypatch.setenv("METASYN_PARALLEL_FIT", "1")
+    monkeypatch.setattr("metasyn.provider._PARALLEL_FIT_MIN_LENGTH", 0)
+    parallel_dist = plist.fit(series, "discrete", DistributionSpec())
+    assert type(serial_dist) is type(parallel_dist)
+    assert serial_dist.to_dict() == parallel_dist.to_dict()
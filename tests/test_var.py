@@ -284,3 +284,29 @@ def test_error_multinoulli():
         MultinoulliDistribution(["1", "2"], [-0.1, 1.1])
     with pytest.warns():
         MultinoulliDistribution(["1", "2"], [0.1, 0.2])
+
+
+@mark.parametrize("prop_missing", [0.0, 0.5, 1.0])
+def test_draw_series_missing(prop_missing):
+    var = MetaVar("test", "discrete", UniqueKeyDistribution(0, True), prop_missing=prop_missing)
+    series = var.draw_series(1000)
+    assert len(series) == 1000
+    assert abs(series.null_count()/1000 - prop_missing) < 0.1
+    # Values are drawn in order for the positions that are not missing.
+    assert series.drop_nulls().to_list() == list(range(1000 - series.null_count()))
+
+
+@mark.parametrize("distribution", [NormalDistribution(0, 1), RegexDistribution(r"[a-z]{3}"),
+                                   UniqueKeyDistribution(0, True)])
+@mark.parametrize("dtype,expected", [("Float64", pl.Null), ("Categorical", pl.Categorical)])
+def test_draw_series_all_missing(distribution, dtype, expected):
+    var = MetaVar("test", "continuous", distribution, dtype=dtype, prop_missing=1.0)
+    series = var.draw_series(10)
+    assert series.null_count() == 10
+    assert series.dtype == expected
+
+
+def test_fit_empty():
+    var = MetaVar.fit(pl.Series("empty", [], dtype=pl.Float64))
+    assert var.prop_missing == 0.0
+    assert len(var.draw_series(10)) == 10